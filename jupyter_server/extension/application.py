@@ -277,7 +277,8 @@ class ExtensionApp(JupyterApp):
         """The default config file name."""
         if not self.name:
             return ""
-        return "jupyter_{}_config".format(self.name.replace("-", "_"))
+        name = self.name.replace("-", "_")
+        return f"jupyter_{name}_config"
 
     def initialize_settings(self):
         """Override this method to add handling of settings."""
@@ -2,31 +2,65 @@
 from __future__ import annotations
 
 import importlib
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from itertools import starmap
 
 from tornado.gen import multi
-from traitlets import Any, Bool, Dict, HasTraits, Instance, List, Unicode, default, observe
-from traitlets import validate as validate_trait
+from traitlets import Any, Bool, Dict, Instance, List, Set, Unicode, default, observe
 from traitlets.config import LoggingConfigurable
 
 from .config import ExtensionConfigManager
 from .utils import ExtensionMetadataError, ExtensionModuleNotFound, get_loader, get_metadata
 
 
-class ExtensionPoint(HasTraits):
+def _cached_import(module_name):
+    """Import a module, reusing it from sys.modules if already imported.
+
+    Modules that are still being initialized (e.g. by another thread) go
+    through importlib so we wait for the import to finish.
+    """
+    try:
+        module = sys.modules[module_name]
+    except KeyError:
+        pass
+    else:
+        spec = getattr(module, "__spec__", None)
+        if spec is not None and getattr(spec, "_initializing", False) is False:
+            return module
+    return importlib.import_module(module_name)
+
+
+def _noop_linker(serverapp):
+    """Linker used by extension points that don't define one."""
+
+
+class ExtensionPoint:
     """A simple API for connecting to a Jupyter Server extension
     point defined by metadata and importable from a Python package.
     """
 
-    _linked = Bool(False)
-    _app = Any(None, allow_none=True)
+    __slots__ = (
+        "metadata",
+        "_module",
+        "_module_name",
+        "_app",
+        "_name",
+        "_linked",
+        "_linker",
+        "_loader",
+    )
 
-    metadata = Dict()
+    def __init__(self, *, metadata):
+        """Initialize an extension point from its metadata."""
+        self._linked = False
+        self._app = None
+        self._linker = None
+        self._loader = None
+        self.metadata = self._valid_metadata(metadata)
 
-    @validate_trait("metadata")
-    def _valid_metadata(self, proposed):
+    def _valid_metadata(self, metadata):
         """Validate metadata."""
-        metadata = proposed["value"]
         # Verify that the metadata has a "name" key.
         try:
             self._module_name = metadata["module"]
@@ -35,7 +69,7 @@ class ExtensionPoint(HasTraits):
             raise ExtensionMetadataError(msg) from None
 
         try:
-            self._module = importlib.import_module(self._module_name)
+            self._module = _cached_import(self._module_name)
         except ImportError:
             msg = (
                 f"The submodule '{self._module_name}' could not be found. Are you "
@@ -45,6 +79,9 @@ class ExtensionPoint(HasTraits):
         # If the metadata includes an ExtensionApp, create an instance.
         if "app" in metadata:
             self._app = metadata["app"]()
+            self._name = self._app.name
+        else:
+            self._name = metadata.get("name", self._module_name)
         return metadata
 
     @property
@@ -54,8 +91,9 @@ class ExtensionPoint(HasTraits):
         Will pull from ExtensionApp's trait, if this point
         is an instance of ExtensionApp.
         """
-        if self.app:
-            return self.app._linked
+        app = self._app
+        if app:
+            return app._linked
         return self._linked
 
     @property
@@ -66,8 +104,9 @@ class ExtensionPoint(HasTraits):
     @property
     def config(self):
         """Return any configuration provided by this extension point."""
-        if self.app:
-            return self.app._jupyter_server_config()
+        app = self._app
+        if app:
+            return app._jupyter_server_config()
         # At some point, we might want to add logic to load config from
         # disk when extensions don't use ExtensionApp.
         else:
@@ -87,9 +126,7 @@ class ExtensionPoint(HasTraits):
         If it's not provided in the metadata, `name` is set
         to the extensions' module name.
         """
-        if self.app:
-            return self.app.name
-        return self.metadata.get("name", self.module_name)
+        return self._name
 
     @property
     def module(self):
@@ -98,24 +135,29 @@ class ExtensionPoint(HasTraits):
 
     def _get_linker(self):
         """Get a linker."""
-        if self.app:
-            linker = self.app._link_jupyter_server_extension
-        else:
-            linker = getattr(
-                self.module,
-                # Search for a _link_jupyter_extension
-                "_link_jupyter_server_extension",
-                # Otherwise return a dummy function.
-                lambda serverapp: None,
-            )
+        linker = self._linker
+        if linker is None:
+            if self._app:
+                linker = self._app._link_jupyter_server_extension
+            else:
+                linker = getattr(
+                    self._module,
+                    # Search for a _link_jupyter_extension
+                    "_link_jupyter_server_extension",
+                    # Otherwise return a dummy function.
+                    _noop_linker,
+                )
+            self._linker = linker
         return linker
 
     def _get_loader(self):
         """Get a loader."""
-        loc = self.app
-        if not loc:
-            loc = self.module
-        loader = get_loader(loc)
+        loader = self._loader
+        if loader is None:
+            loc = self._app
+            if not loc:
+                loc = self._module
+            loader = self._loader = get_loader(loc)
         return loader
 
     def validate(self):
@@ -162,7 +204,7 @@ class ExtensionPackage(LoggingConfigurable):
     name = Unicode(help="Name of the an importable Python package.")
     enabled = Bool(False, help="Whether the extension package is enabled.")
 
-    _linked_points = Dict()
+    _linked_points = Set()
     extension_points = Dict()
     module = Any(allow_none=True, help="The module for this extension package. None if not enabled")
     metadata = List(Dict(), help="Extension metadata loaded from the extension package.")
@@ -200,9 +242,8 @@ class ExtensionPackage(LoggingConfigurable):
             )
             raise ExtensionModuleNotFound(msg) from None
         # Create extension point interfaces for each extension path.
-        for m in self.metadata:
-            point = ExtensionPoint(metadata=m)
-            self.extension_points[point.name] = point
+        points = (ExtensionPoint(metadata=m) for m in self.metadata)
+        self.extension_points = {point.name: point for point in points}
         return name
 
     def validate(self):
@@ -211,10 +252,10 @@ class ExtensionPackage(LoggingConfigurable):
 
     def link_point(self, point_name, serverapp):
         """Link an extension point."""
-        linked = self._linked_points.get(point_name, False)
-        if not linked:
+        if point_name not in self._linked_points:
             point = self.extension_points[point_name]
             point.link(serverapp)
+            self._linked_points.add(point_name)
 
     def load_point(self, point_name, serverapp):
         """Load an extension point."""
@@ -223,12 +264,15 @@ class ExtensionPackage(LoggingConfigurable):
 
     def link_all_points(self, serverapp):
         """Link all extension points."""
-        for point_name in self.extension_points:
-            self.link_point(point_name, serverapp)
+        linked_points = self._linked_points
+        for point_name, point in self.extension_points.items():
+            if point_name not in linked_points:
+                point.link(serverapp)
+                linked_points.add(point_name)
 
     def load_all_points(self, serverapp):
         """Load all extension points."""
-        return [self.load_point(point_name, serverapp) for point_name in self.extension_points]
+        return [point.load(serverapp) for point in self.extension_points.values()]
 
 
 class ExtensionManager(LoggingConfigurable):
@@ -243,6 +287,19 @@ class ExtensionManager(LoggingConfigurable):
 
     serverapp = Any()  # Use Any to avoid circular import of Instance(ServerApp)
 
+    parallel_load = Bool(
+        False,
+        config=True,
+        help="""Load thread-safe extensions concurrently in a thread pool.
+
+        Only extensions whose extension points all set `"thread_safe": True`
+        in their metadata, and none of which is an ExtensionApp, are loaded
+        from the thread pool. All other extensions are loaded first, serially
+        and in alphabetical order, on the calling thread. The loading order of
+        the thread-safe extensions is not deterministic.
+        """,
+    )
+
     @default("config_manager")
     def _load_default_config_manager(self):
         config_manager = ExtensionConfigManager()
@@ -318,6 +375,10 @@ class ExtensionManager(LoggingConfigurable):
         """Try to add extension to manager, return True if successful.
         Otherwise, return False.
         """
+        extpkg = self.extensions.get(extension_name)
+        if extpkg is not None and extpkg.enabled == enabled:
+            # Already added, e.g. listed in more than one config source.
+            return True
         try:
             extpkg = ExtensionPackage(name=extension_name, enabled=enabled)
             self.extensions[extension_name] = extpkg
@@ -386,10 +447,34 @@ class ExtensionManager(LoggingConfigurable):
         """Load all enabled extensions and append them to
         the parent ServerApp.
         """
-        # Sort the extension names to enforce deterministic loading
-        # order.
-        for name in self.sorted_extensions:
+        if not self.parallel_load:
+            # Sort the extension names to enforce deterministic loading
+            # order.
+            for name in self.sorted_extensions:
+                self.load_extension(name)
+            return
+
+        serial, parallel = [], []
+        for name, extension in self.sorted_extensions.items():
+            points = extension.extension_points.values()
+            # Extensions must opt in to being loaded from a thread.
+            # ExtensionApp loaders update the shared webapp settings
+            # and handlers, so they are never loaded concurrently.
+            if (
+                points
+                and all(point.metadata.get("thread_safe", False) for point in points)
+                and not any(point.app for point in points)
+            ):
+                parallel.append(name)
+            else:
+                serial.append(name)
+        # Extensions that are not thread-safe are loaded first, serially
+        # and in alphabetical order, on the calling thread.
+        for name in serial:
             self.load_extension(name)
+        if parallel:
+            with ThreadPoolExecutor(max_workers=min(32, len(parallel))) as executor:
+                list(executor.map(self.load_extension, parallel))
 
     async def stop_all_extensions(self):
         """Call the shutdown hooks in all extensions."""
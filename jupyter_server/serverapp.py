@@ -803,6 +803,7 @@ class ServerApp(JupyterApp):
         Authorizer,
         EventLogger,
         ZMQChannelsWebsocketConnection,
+        ExtensionManager,
     ]
 
     subcommands: dict[str, t.Any] = {
@@ -2375,7 +2376,7 @@ class ServerApp(JupyterApp):
         and load its own config.
         """
         # Create an instance of the ExtensionManager.
-        self.extension_manager = ExtensionManager(log=self.log, serverapp=self)
+        self.extension_manager = ExtensionManager(parent=self, log=self.log, serverapp=self)
         self.extension_manager.from_jpserver_extensions(self.jpserver_extensions)
         self.extension_manager.link_all_extensions()
 
@@ -0,0 +1,11 @@
+"""A mock extension that may be loaded from a thread pool,
+for testing purposes.
+"""
+
+
+def _jupyter_server_extension_points():
+    return [{"module": "tests.extension.mockextensions.mockext_threadsafe", "thread_safe": True}]
+
+
+def _load_jupyter_server_extension(serverapp):
+    serverapp.mock_threadsafe = True
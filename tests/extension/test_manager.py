@@ -1,5 +1,6 @@
 import os
 import sys
+import threading
 from unittest import mock
 
 import pytest
@@ -76,6 +77,21 @@ def test_extension_package_notfound_error():
     ExtensionPackage(name="nonexistent", enabled=False)
 
 
+def test_extension_state_not_shared():
+    name = "tests.extension.mockextensions"
+    pkg1 = ExtensionPackage(name=name, enabled=True)
+    pkg2 = ExtensionPackage(name=name, enabled=True)
+    assert pkg1._linked_points is not pkg2._linked_points
+    assert pkg1.extension_points is not pkg2.extension_points
+
+    manager1 = ExtensionManager()
+    manager2 = ExtensionManager()
+    manager1.add_extension(name, enabled=True)
+    assert name in manager1.extensions
+    assert name not in manager2.extensions
+    assert manager1.linked_extensions is not manager2.linked_extensions
+
+
 def _normalize_path(path_list):
     return [p.rstrip(os.path.sep) for p in path_list]
 
@@ -91,6 +107,18 @@ def test_extension_manager_api(jp_serverapp):
     assert "tests.extension.mockextensions" in manager.extensions
 
 
+def test_extension_manager_add_twice(jp_serverapp):
+    name = "tests.extension.mockextensions"
+    manager = ExtensionManager(serverapp=jp_serverapp)
+    assert manager.add_extension(name, enabled=True)
+    extpkg = manager.extensions[name]
+    assert manager.add_extension(name, enabled=True)
+    assert manager.extensions[name] is extpkg
+    # changing the enabled state replaces the package
+    assert manager.add_extension(name, enabled=False)
+    assert not manager.extensions[name].enabled
+
+
 def test_extension_manager_linked_extensions(jp_serverapp):
     name = "tests.extension.mockextensions"
     manager = ExtensionManager(serverapp=jp_serverapp)
@@ -99,6 +127,25 @@ def test_extension_manager_linked_extensions(jp_serverapp):
     assert name in manager.linked_extensions
 
 
+def test_extension_package_link_once(jp_serverapp):
+    e = ExtensionPackage(name="tests.extension.mockextensions", enabled=True)
+    with mock.patch.object(ExtensionPoint, "link") as link:
+        e.link_all_points(jp_serverapp)
+        e.link_all_points(jp_serverapp)
+    assert link.call_count == len(e.extension_points)
+    assert e._linked_points == set(e.extension_points)
+
+
+def test_extension_manager_link_once(jp_serverapp):
+    name = "tests.extension.mockextensions"
+    manager = ExtensionManager(serverapp=jp_serverapp)
+    manager.add_extension(name, enabled=True)
+    with mock.patch.object(ExtensionPackage, "link_all_points") as link_all_points:
+        manager.link_all_extensions()
+        manager.link_all_extensions()
+    link_all_points.assert_called_once_with(jp_serverapp)
+
+
 @pytest.mark.parametrize("has_app", [True, False])
 def test_extension_manager_fail_add(jp_serverapp, has_app):
     name = "tests.extension.notanextension"
@@ -112,6 +159,18 @@ def test_extension_manager_fail_add(jp_serverapp, has_app):
         assert manager.add_extension(name, enabled=True) is False
 
 
+def test_extension_manager_fail_app_init(jp_serverapp):
+    name = "tests.extension.mockextensions.app"
+    with mock.patch(
+        "tests.extension.mockextensions.app.MockExtensionApp.__init__",
+        side_effect=RuntimeError,
+    ):
+        manager = ExtensionManager(serverapp=jp_serverapp)
+        assert manager.add_extension(name, enabled=True) is False
+    assert name not in manager.extensions
+    assert manager.extension_apps == {}
+
+
 @pytest.mark.parametrize("has_app", [True, False])
 def test_extension_manager_fail_link(jp_serverapp, has_app):
     name = "tests.extension.mockextensions.app"
@@ -149,6 +208,47 @@ def test_extension_manager_fail_load(jp_serverapp, has_app):
             manager.load_extension(name)
 
 
+def test_extension_manager_parallel_load(jp_serverapp):
+    app_ext = "tests.extension.mockextensions.app"
+    serial_ext = "tests.extension.mockextensions.mock1"
+    threadsafe_ext = "tests.extension.mockextensions.mockext_threadsafe"
+    manager = ExtensionManager(serverapp=jp_serverapp, parallel_load=True)
+    for name in [app_ext, serial_ext, threadsafe_ext]:
+        manager.add_extension(name, enabled=True)
+    manager.link_all_extensions()
+
+    threads = {}
+    load_extension = manager.load_extension
+
+    def record_thread(name):
+        threads[name] = threading.current_thread()
+        load_extension(name)
+
+    with mock.patch.object(manager, "load_extension", side_effect=record_thread):
+        manager.load_all_extensions()
+    assert manager.extension_points["mockextension"].app.loaded
+    assert jp_serverapp.mockI
+    assert jp_serverapp.mock_threadsafe
+    # ExtensionApps and extensions that don't opt in are loaded serially
+    assert threads[app_ext] is threading.current_thread()
+    assert threads[serial_ext] is threading.current_thread()
+    assert threads[threadsafe_ext] is not threading.current_thread()
+
+
+def test_extension_manager_parallel_load_reraise(jp_serverapp):
+    name = "tests.extension.mockextensions.mockext_threadsafe"
+    with mock.patch(
+        f"{name}._load_jupyter_server_extension",
+        side_effect=RuntimeError,
+    ):
+        manager = ExtensionManager(serverapp=jp_serverapp, parallel_load=True)
+        manager.add_extension(name, enabled=True)
+        manager.link_all_extensions()
+        jp_serverapp.reraise_server_extension_failures = True
+        with pytest.raises(RuntimeError):
+            manager.load_all_extensions()
+
+
 @pytest.mark.parametrize("has_app", [True, False])
 def test_disable_no_import(jp_serverapp, has_app):
     # de-import modules so we can detect if they are re-imported